@@ -1,8 +1,5 @@
-from sudoku_solver import (
-    Difficulty,
-    generate_solvable_board,
-    generate_sudoku_board,
-)
+from sudoku import CLASSIC_RULES, Difficulty, Rules
+from sudoku.generator import generate_solvable_board, generate_sudoku_board
 from datetime import datetime
 import pygame
 
@@ -10,6 +7,7 @@ import pygame
 # global settings
 BG_COLOR = (11, 13, 8)
 TEXT_COLOR = (242, 242, 242)
+VARIANT_COLOR = (120, 120, 120)
 THICK_LINE = 5
 SLIM_LINE = 1
 
@@ -87,7 +85,7 @@ class Button:
         start_x, start_y, end_x, end_y = self.position
 
         pygame.draw.rect(
-            window,
+            self.window,
             TEXT_COLOR,
             (start_x, start_y, self.width, self.height),
             3,
@@ -98,7 +96,7 @@ class Button:
             (start_x + end_x) / 2 - (text.get_width() // 2),
             (start_y + end_y) / 2 - (text.get_height() // 2),
         )
-        window.blit(text, centered_text)
+        self.window.blit(text, centered_text)
 
 
 class Timer:
@@ -135,11 +133,11 @@ class Timer:
 
         if position == None:
             ## draw timer at bottom-right
-            x = window.get_width() - text.get_width() - 10
-            y = window.get_height() - text.get_height() - 10
+            x = self.window.get_width() - text.get_width() - 10
+            y = self.window.get_height() - text.get_height() - 10
             position = (x, y)
 
-        window.blit(text, position)
+        self.window.blit(text, position)
 
     def format_time(self) -> str:
         """
@@ -158,13 +156,17 @@ class Board:
     cells = []
 
     def __init__(
-        self, window: pygame.Surface, difficulty: Difficulty = Difficulty.Medium
+        self,
+        window: pygame.Surface,
+        difficulty: Difficulty = Difficulty.Medium,
+        rules: Rules = CLASSIC_RULES,
     ):
         self.window = window
-        self.solved_board = generate_solvable_board()
+        self.rules = rules
+        self.solved_board = generate_solvable_board(rules)
         self.total_board_width = window.get_width()
         self.cell_line_size = self.total_board_width / 9
-        self.board = generate_sudoku_board(difficulty, self.solved_board)
+        self.board = generate_sudoku_board(difficulty, self.solved_board, rules)
         self.selected = None
         self.current_selected = None
         self.is_draft_enabled = False
@@ -175,14 +177,16 @@ class Board:
         if difficulty == None:
             return
 
-        self.solved_board = generate_solvable_board()
-        self.board = generate_sudoku_board(difficulty, self.solved_board)
+        self.solved_board = generate_solvable_board(self.rules)
+        self.board = generate_sudoku_board(difficulty, self.solved_board, self.rules)
         self._create_cells()
         self.is_completed = False
         self.mistakes_count = 0
 
     def draw(self):
         self._draw_grid()
+        self._draw_diagonals()
+        self._draw_cages()
         self._draw_mistakes_counter()
 
         if self.cells == None:
@@ -257,32 +261,12 @@ class Board:
                 self.mistakes_count += 1
 
     def get_possibilities(self, coordinates: tuple) -> dict:
-        row = self.board[coordinates[0]]
-        column = [
-            self.board[row_index][coordinates[1]]
-            for row_index in range(len(self.board))
-        ]
-        square = []
-
-        start_row = coordinates[0] - coordinates[0] % 3
-        start_col = coordinates[1] - coordinates[1] % 3
-        for row_index in range(start_row, start_row + 3):
-            for col_index in range(start_col, start_col + 3):
-                square.append(self.board[row_index][col_index])
-
         possibilities = {}
 
         # need to exclude 0
         possibilities[0] = 0
-        for item in row:
-            if item not in possibilities:
-                possibilities[item] = item
-
-        for item in column:
-            if item not in possibilities:
-                possibilities[item] = item
-
-        for item in square:
+        for row, col in self.rules.peers[coordinates[0]][coordinates[1]]:
+            item = self.board[row][col]
             if item not in possibilities:
                 possibilities[item] = item
 
@@ -307,7 +291,7 @@ class Board:
     # Private functions
     def _draw_grid(self):
         for i in range(len(self.board) + 1):
-            if i % 3 == 0 and i != 0:
+            if i == len(self.board):
                 line_thickness = THICK_LINE
             else:
                 line_thickness = SLIM_LINE
@@ -330,6 +314,70 @@ class Board:
                 line_thickness,
             )
 
+        # Region borders, 3x3 boxes or jigsaw shapes
+        region_of = {}
+        for region_index, region in enumerate(self.rules.units_of_kind("region")):
+            for cell in region.cells:
+                region_of[cell] = region_index
+
+        for (row, col), region_index in region_of.items():
+            for neighbour in ((row + 1, col), (row, col + 1)):
+                if region_of.get(neighbour, region_index) != region_index:
+                    self._draw_cell_side((row, col), neighbour, THICK_LINE)
+
+    def _draw_cell_side(
+        self, cell: tuple, neighbour: tuple, line_thickness: int, inset: int = 0
+    ):
+        size = self.cell_line_size
+        x, y = cell[0] * size, cell[1] * size
+
+        if neighbour[0] != cell[0]:
+            # vertical side, left or right
+            side_x = x + inset if neighbour[0] < cell[0] else x + size - inset
+            start, end = (side_x, y + inset), (side_x, y + size - inset)
+        else:
+            # horizontal side, top or bottom
+            side_y = y + inset if neighbour[1] < cell[1] else y + size - inset
+            start, end = (x + inset, side_y), (x + size - inset, side_y)
+
+        pygame.draw.line(self.window, TEXT_COLOR, start, end, line_thickness)
+
+    def _draw_diagonals(self):
+        for diagonal in self.rules.units_of_kind("diagonal"):
+            first, last = diagonal.cells[0], diagonal.cells[-1]
+            start = (
+                (first[0] + 0.5) * self.cell_line_size,
+                (first[1] + 0.5) * self.cell_line_size,
+            )
+            end = (
+                (last[0] + 0.5) * self.cell_line_size,
+                (last[1] + 0.5) * self.cell_line_size,
+            )
+            pygame.draw.line(self.window, VARIANT_COLOR, start, end, SLIM_LINE)
+
+    def _draw_cages(self):
+        font = pygame.font.Font(None, 20)
+
+        for cage in self.rules.units_of_kind("cage"):
+            cells = set(cage.cells)
+            for row, col in cells:
+                for neighbour in (
+                    (row - 1, col),
+                    (row + 1, col),
+                    (row, col - 1),
+                    (row, col + 1),
+                ):
+                    if neighbour not in cells:
+                        self._draw_cell_side((row, col), neighbour, SLIM_LINE, 4)
+
+            # total goes in the top-left cell of the cage
+            row, col = min(cells, key=lambda cell: (cell[1], cell[0]))
+            text = font.render(f"{cage.total}", True, VARIANT_COLOR)
+            self.window.blit(
+                text,
+                (row * self.cell_line_size + 6, col * self.cell_line_size + 6),
+            )
+
     def _draw_mistakes_counter(self):
         font = pygame.font.Font(None, 50)
         color = (187, 0, 0)
@@ -379,6 +427,7 @@ class Sudoku_Cell:
     SELECTED_COLOR = (103, 205, 235)
 
     def __init__(self, window: pygame.Surface, position: tuple, value: int):
+        self.window = window
         self.width = window.get_width() / 9
         self.height = window.get_width() / 9
         self.inner_square_size = self.width / 3
@@ -406,7 +455,7 @@ class Sudoku_Cell:
             font = pygame.font.Font(None, 80)
             text = font.render(f"{self.value}", True, color)
 
-            window.blit(
+            self.window.blit(
                 text,
                 self._center_text(
                     start_position, end_position, (text.get_width(), text.get_height())
@@ -416,7 +465,7 @@ class Sudoku_Cell:
         # draw selection
         if self.selected:
             pygame.draw.rect(
-                window, self.SELECTED_COLOR, (start_position, end_position), THICK_LINE
+                self.window, self.SELECTED_COLOR, (start_position, end_position), THICK_LINE
             )
 
     def _center_text(self, start: tuple, end: tuple, text_size: tuple) -> tuple:
@@ -444,7 +493,7 @@ class Sudoku_Cell:
                     + (text.get_height() / 2),
                 )
 
-                window.blit(text, text_position)
+                self.window.blit(text, text_position)
 
     # Properties
     def select(self, select: bool):
@@ -536,10 +585,10 @@ def draw_objects(*objects):
         object.draw()
 
 
-def main(window: pygame.Surface):
+def main(window: pygame.Surface, rules: Rules = CLASSIC_RULES):
     # Create items
     timer = Timer(window)
-    board = Board(window)
+    board = Board(window, rules=rules)
 
     easy_button = Button(
         window, "Easy", Difficulty.Easy, (10, window.get_height() - 165)
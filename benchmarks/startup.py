@@ -0,0 +1,66 @@
+"""
+Measures import-to-first-solve time of the sudoku package in fresh
+interpreters, the cost every new worker process pays.
+
+    python benchmarks/startup.py [--runs N] [--max-ms MS]
+
+Exits with status 1 if the median is above --max-ms.
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+PACKAGE_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+PUZZLE = "530070000600195000098000060800060003400803001700020006060000280000419005000080079"
+
+MEASURE = f"""
+import time
+started = time.perf_counter()
+import sudoku
+imported = time.perf_counter()
+from sudoku.io import parse_board
+sudoku.solve_board(parse_board("{PUZZLE}"))
+solved = time.perf_counter()
+print((imported - started) * 1000, (solved - started) * 1000)
+"""
+
+
+def measure_once() -> tuple:
+    output = subprocess.run(
+        [sys.executable, "-c", MEASURE],
+        cwd=PACKAGE_ROOT,
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    import_ms, first_solve_ms = output.split()
+    return float(import_ms), float(first_solve_ms)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--runs", type=int, default=20)
+    parser.add_argument("--max-ms", type=float, default=None)
+    args = parser.parse_args()
+
+    # first run warms the bytecode cache
+    measure_once()
+    results = [measure_once() for _ in range(args.runs)]
+    import_ms = statistics.median(result[0] for result in results)
+    first_solve_ms = statistics.median(result[1] for result in results)
+
+    print(f"import sudoku:          {import_ms:6.2f} ms (median of {args.runs})")
+    print(f"import to first solve:  {first_solve_ms:6.2f} ms (median of {args.runs})")
+
+    if args.max_ms != None and first_solve_ms > args.max_ms:
+        print(f"slower than {args.max_ms} ms", file=sys.stderr)
+        return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
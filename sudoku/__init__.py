@@ -0,0 +1,47 @@
+"""
+Headless sudoku solver and generator.
+
+Only the solver and the variant rules are imported eagerly; everything else
+is loaded on first use, so importing the package stays cheap for short-lived
+worker processes.
+"""
+from sudoku.rules import (
+    CLASSIC_RULES,
+    ConstraintUnit,
+    Rules,
+    anti_knight_units,
+    cage_units,
+    diagonal_units,
+    standard_units,
+)
+from sudoku.solver import (
+    BLANK_GRID,
+    GRID_SIZE,
+    Difficulty,
+    check_valid_option,
+    solve_board,
+)
+
+_LAZY_ATTRIBUTES = {
+    "generate_sudoku_board": "sudoku.generator",
+    "generate_solvable_board": "sudoku.generator",
+    "prepare_board": "sudoku.generator",
+    "print_formatted_sudoku_grid": "sudoku.io",
+    "parse_board": "sudoku.io",
+    "format_board": "sudoku.io",
+    "read_boards": "sudoku.io",
+    "write_boards": "sudoku.io",
+    "solve_corpus": "sudoku.jobs",
+    "generate_corpus": "sudoku.jobs",
+}
+
+
+def __getattr__(name: str):
+    if name not in _LAZY_ATTRIBUTES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    import importlib
+
+    value = getattr(importlib.import_module(_LAZY_ATTRIBUTES[name]), name)
+    globals()[name] = value
+    return value
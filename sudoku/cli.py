@@ -0,0 +1,197 @@
+import argparse
+import sys
+
+from sudoku.rules import (
+    Rules,
+    anti_knight_units,
+    diagonal_units,
+    parse_layout,
+    standard_units,
+)
+from sudoku.solver import Difficulty, solve_board
+
+
+def build_rules(args) -> Rules:
+    layout = None
+    if args.regions != None:
+        layout = parse_layout(args.regions)
+
+    units = standard_units(layout)
+    if args.diagonal:
+        units += diagonal_units()
+    if args.anti_knight:
+        units += anti_knight_units()
+
+    return Rules(units)
+
+
+def solve_command(args) -> int:
+    from sudoku.io import format_board, parse_board
+
+    rules = build_rules(args)
+    exit_code = 0
+    for line_number, line in enumerate(args.input, 1):
+        line = line.strip()
+        if line == "" or line.startswith("#"):
+            continue
+
+        try:
+            board = parse_board(line)
+        except ValueError as error:
+            print(f"line {line_number}: {error}", file=sys.stderr)
+            exit_code = 1
+            continue
+
+        if not solve_board(board, rules):
+            print(
+                f"line {line_number}: the sudoku board is unsolvable.",
+                file=sys.stderr,
+            )
+            exit_code = 1
+            continue
+
+        args.output.write(format_board(board) + "\n")
+
+    return exit_code
+
+
+def generate_command(args) -> int:
+    from sudoku.generator import generate_sudoku_board
+    from sudoku.io import format_board
+
+    rules = build_rules(args)
+    difficulty = Difficulty[args.difficulty]
+    for _ in range(args.count):
+        board = generate_sudoku_board(difficulty, rules=rules)
+        args.output.write(format_board(board) + "\n")
+
+    return 0
+
+
+def positive_int(value: str) -> int:
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be positive, got {number}")
+
+    return number
+
+
+def non_negative_int(value: str) -> int:
+    number = int(value)
+    if number < 0:
+        raise argparse.ArgumentTypeError(f"can't be negative, got {number}")
+
+    return number
+
+
+def solve_corpus_command(args) -> int:
+    from sudoku.jobs import solve_corpus
+
+    rules = build_rules(args)
+    solve_corpus(args.input, args.output_directory, args.shard_size, rules)
+    return 0
+
+
+def generate_corpus_command(args) -> int:
+    from sudoku.jobs import generate_corpus
+
+    targets = {}
+    for difficulty in Difficulty:
+        count = getattr(args, difficulty.name.lower())
+        if count > 0:
+            targets[difficulty] = count
+
+    rules = build_rules(args)
+    generate_corpus(
+        args.output_directory, targets, args.shard_size, args.seed, rules
+    )
+    return 0
+
+
+def main(argv: list = None) -> int:
+    variant_parser = argparse.ArgumentParser(add_help=False)
+    variant_parser.add_argument(
+        "--diagonal", action="store_true", help="both main diagonals hold 1-9"
+    )
+    variant_parser.add_argument(
+        "--anti-knight",
+        action="store_true",
+        help="cells a knight's move apart can't repeat a digit",
+    )
+    variant_parser.add_argument(
+        "--regions",
+        metavar="LAYOUT",
+        help="jigsaw regions as 81 labels, row by row, instead of 3x3 boxes",
+    )
+
+    parser = argparse.ArgumentParser(
+        prog="python -m sudoku", description="Sudoku solver and generator."
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    solve_parser = subparsers.add_parser(
+        "solve",
+        parents=[variant_parser],
+        help="solve boards, one 81-character board per line",
+    )
+    solve_parser.add_argument(
+        "input", nargs="?", type=argparse.FileType("r"), default=sys.stdin
+    )
+    solve_parser.add_argument(
+        "-o", "--output", type=argparse.FileType("w"), default=sys.stdout
+    )
+    solve_parser.set_defaults(handler=solve_command)
+
+    generate_parser = subparsers.add_parser(
+        "generate", parents=[variant_parser], help="generate new boards"
+    )
+    generate_parser.add_argument(
+        "-d",
+        "--difficulty",
+        choices=[difficulty.name for difficulty in Difficulty],
+        default=Difficulty.Medium.name,
+    )
+    generate_parser.add_argument("-n", "--count", type=positive_int, default=1)
+    generate_parser.add_argument(
+        "-o", "--output", type=argparse.FileType("w"), default=sys.stdout
+    )
+    generate_parser.set_defaults(handler=generate_command)
+
+    solve_corpus_parser = subparsers.add_parser(
+        "solve-corpus",
+        parents=[variant_parser],
+        help="solve a corpus in resumable shards, rerun to resume",
+    )
+    solve_corpus_parser.add_argument("input")
+    solve_corpus_parser.add_argument("output_directory")
+    solve_corpus_parser.add_argument(
+        "--shard-size", type=positive_int, default=10000
+    )
+    solve_corpus_parser.set_defaults(handler=solve_corpus_command)
+
+    generate_corpus_parser = subparsers.add_parser(
+        "generate-corpus",
+        parents=[variant_parser],
+        help="generate a corpus in resumable shards, rerun to resume",
+    )
+    generate_corpus_parser.add_argument("output_directory")
+    for difficulty in Difficulty:
+        generate_corpus_parser.add_argument(
+            f"--{difficulty.name.lower()}",
+            type=non_negative_int,
+            default=0,
+            metavar="N",
+            help=f"number of {difficulty.name} boards",
+        )
+    generate_corpus_parser.add_argument(
+        "--shard-size", type=positive_int, default=1000
+    )
+    generate_corpus_parser.add_argument("--seed", type=int, default=0)
+    generate_corpus_parser.set_defaults(handler=generate_corpus_command)
+
+    args = parser.parse_args(argv)
+    try:
+        return args.handler(args)
+    except (ValueError, OSError) as error:
+        print(f"{parser.prog}: error: {error}", file=sys.stderr)
+        return 1
@@ -0,0 +1,110 @@
+from sudoku.rules import CLASSIC_RULES, Rules
+from sudoku.solver import (
+    BLANK_GRID,
+    GRID_SIZE,
+    Difficulty,
+    check_valid_option,
+    solve_board,
+)
+
+# Some random seeds have no solution and take very long to prove it, so the
+# generator gives up on a seed after this many guesses (see solve_board).
+# Solvable seeds of classic, diagonal and jigsaw boards need fewer than 250;
+# anti-knight ones have a long tail (median about 80, 99th percentile about
+# 2,700) where dropping a seed is cheaper than searching on. Rules that no
+# seed solves fail after GENERATION_ATTEMPTS fresh seeds.
+SEED_SOLVE_STEPS = 1000
+GENERATION_ATTEMPTS = 10
+
+
+def generate_sudoku_board(
+    difficulty: Difficulty = Difficulty.Medium,
+    board: list = None,
+    rules: Rules = CLASSIC_RULES,
+    rng=None,
+) -> list:
+    """
+    rng = random.Random instance for reproducible boards, the random module
+    is used when not given.
+    """
+    if board == None:
+        board_copy = generate_solvable_board(rules, rng)
+    else:
+        board_copy = [row[:] for row in board]
+
+    return prepare_board(board_copy, difficulty.value, rng)
+
+
+def generate_solvable_board(rules: Rules = CLASSIC_RULES, rng=None) -> list:
+    """
+    Seeds a few random values and solves the rest. When the seed doesn't
+    solve within SEED_SOLVE_STEPS guesses, seeded values are dropped, last
+    first, and once none are left the board is seeded again, up to
+    GENERATION_ATTEMPTS times.
+    """
+    for _ in range(GENERATION_ATTEMPTS):
+        board, seeded = _seed_board(rules, rng)
+
+        while True:
+            solved_board = [row[:] for row in board]
+            if solve_board(solved_board, rules, SEED_SOLVE_STEPS):
+                return solved_board
+
+            if len(seeded) == 0:
+                break
+
+            row, col = seeded.pop()
+            board[row][col] = 0
+
+    raise ValueError(
+        f"Couldn't generate a board for rules: {rules.describe()}. No seed "
+        f"solved within {SEED_SOLVE_STEPS} guesses in {GENERATION_ATTEMPTS} "
+        "attempts."
+    )
+
+
+def _seed_board(rules: Rules, rng=None) -> tuple:
+    if rng == None:
+        import random as rng
+
+    board = [row[:] for row in BLANK_GRID]
+    seeded = []
+
+    i = 0
+    while i < GRID_SIZE:
+        row = rng.randint(
+            0, GRID_SIZE - 6
+        )  # generate values in couple of rows, not all board;
+        col = rng.randint(0, GRID_SIZE - 1)
+        value = rng.randint(1, GRID_SIZE)
+
+        if (row, col) in seeded:
+            seeded.remove((row, col))
+
+        if not check_valid_option(value, board, (row, col), rules):
+            board[row][col] = 0
+            i -= 1
+
+        else:
+            board[row][col] = value
+            seeded.append((row, col))
+
+        i += 1
+
+    return board, seeded
+
+
+def prepare_board(board: list, fields_to_remove: int, rng=None):
+    if rng == None:
+        import random as rng
+
+    i = 0
+    while i < fields_to_remove * GRID_SIZE:
+        row = rng.randint(0, GRID_SIZE - 1)
+        col = rng.randint(0, GRID_SIZE - 1)
+
+        if board[row][col] != 0:
+            board[row][col] = 0
+            i += 1
+
+    return board
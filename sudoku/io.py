@@ -0,0 +1,68 @@
+from sudoku.solver import GRID_SIZE
+
+BLANK_CHARACTERS = "0."
+
+
+def print_formatted_sudoku_grid(sudoku_board: list):
+    for row_index, row in enumerate(sudoku_board):
+        formatted_row = ""
+        for column_index, item in enumerate(row):
+            if (column_index) % 3 == 0 and column_index != 0:
+                formatted_row += " | "
+
+            formatted_row += f" {item} "
+
+        if row_index % 3 == 0 and row_index != 0:
+            print("-" * len(formatted_row))
+        else:
+            print(" " * len(formatted_row))
+
+        print(formatted_row)
+
+
+def parse_board(line: str) -> list:
+    """
+    Parses a single-line board, 81 characters read row by row.
+    Blank cells can be written as "0" or ".".
+    """
+    line = line.strip()
+    if len(line) != GRID_SIZE * GRID_SIZE:
+        raise ValueError(
+            f"Expected {GRID_SIZE * GRID_SIZE} characters, got {len(line)}."
+        )
+
+    values = []
+    for character in line:
+        if character in BLANK_CHARACTERS:
+            values.append(0)
+        elif character.isdigit():
+            values.append(int(character))
+        else:
+            raise ValueError(f"Invalid character in board: {character!r}.")
+
+    return [values[row * GRID_SIZE : (row + 1) * GRID_SIZE] for row in range(GRID_SIZE)]
+
+
+def format_board(sudoku_board: list) -> str:
+    return "".join(str(item) for row in sudoku_board for item in row)
+
+
+def read_boards(file) -> list:
+    """
+    Reads boards from an open text file, one per line. Blank lines and
+    lines starting with "#" are skipped.
+    """
+    boards = []
+    for line in file:
+        line = line.strip()
+        if line == "" or line.startswith("#"):
+            continue
+        boards.append(parse_board(line))
+
+    return boards
+
+
+def write_boards(file, boards: list):
+    for board in boards:
+        file.write(format_board(board) + "\n")
+
@@ -0,0 +1,223 @@
+"""
+Resumable corpus jobs.
+
+Work is split into fixed-size shards. Each finished shard is written to its
+own file, then the checkpoint is updated; both writes are atomic, so a job
+killed at any point resumes from the first unfinished shard when run again
+with the same arguments. A shard redone after a crash gives the same output:
+solving is deterministic and generation seeds every shard separately.
+
+The checkpoint records the job's settings, including a fingerprint of the
+rules, and a resumed job with other settings is refused. Rules with predicate
+units can't be fingerprinted, so they can't be used in jobs.
+"""
+import json
+import os
+
+from sudoku.rules import CLASSIC_RULES, Rules
+from sudoku.solver import Difficulty, solve_board
+
+CHECKPOINT_FILE = "checkpoint.json"
+UNSOLVABLE = "unsolvable"
+INVALID = "invalid"
+
+
+def solve_corpus(
+    input_path: str,
+    output_directory: str,
+    shard_size: int = 10000,
+    rules: Rules = CLASSIC_RULES,
+    max_shards: int = None,
+) -> bool:
+    """
+    Solves boards from input_path, one per line, into solved-NNNNN.txt shard
+    files. Unsolvable boards are written as "unsolvable" and lines that aren't
+    boards as "invalid", so output lines stay aligned with the input boards.
+    Returns True once the whole corpus is done.
+    """
+    from sudoku.io import format_board, parse_board
+
+    _check_shard_size(shard_size)
+    settings = {
+        "job": "solve",
+        "input": os.path.abspath(input_path),
+        "shard_size": shard_size,
+        "rules": rules.fingerprint(),
+    }
+    checkpoint = _load_checkpoint(
+        output_directory, settings, {"next_shard": 0, "input_offset": 0}
+    )
+
+    shards_done = 0
+    with open(input_path, "rb") as file:
+        file.seek(checkpoint["input_offset"])
+
+        while max_shards == None or shards_done < max_shards:
+            lines = _read_shard(file, shard_size)
+            if len(lines) == 0:
+                return True
+
+            solved = []
+            for line in lines:
+                try:
+                    board = parse_board(line)
+                except ValueError:
+                    solved.append(INVALID)
+                    continue
+
+                if solve_board(board, rules):
+                    solved.append(format_board(board))
+                else:
+                    solved.append(UNSOLVABLE)
+
+            shard_name = f"solved-{checkpoint['next_shard']:05d}.txt"
+            _write_atomic(
+                os.path.join(output_directory, shard_name), "\n".join(solved) + "\n"
+            )
+
+            checkpoint["next_shard"] += 1
+            checkpoint["input_offset"] = file.tell()
+            _save_checkpoint(output_directory, checkpoint)
+            shards_done += 1
+
+        # stopped by max_shards, check if any board is left
+        return len(_read_shard(file, 1)) == 0
+
+
+def generate_corpus(
+    output_directory: str,
+    targets: dict,
+    shard_size: int = 1000,
+    seed: int = 0,
+    rules: Rules = CLASSIC_RULES,
+    max_shards: int = None,
+) -> bool:
+    """
+    targets = {Difficulty: number of boards}.
+    Generates boards into <difficulty>-NNNNN.txt shard files. Every shard uses
+    its own random.Random seeded from seed, difficulty and shard number.
+    Returns True once every target is met.
+    """
+    import random
+
+    from sudoku.generator import generate_sudoku_board
+    from sudoku.io import format_board
+
+    _check_shard_size(shard_size)
+    settings = {
+        "job": "generate",
+        "targets": {difficulty.name: count for difficulty, count in targets.items()},
+        "shard_size": shard_size,
+        "seed": seed,
+        "rules": rules.fingerprint(),
+    }
+    checkpoint = _load_checkpoint(
+        output_directory,
+        settings,
+        {"completed": {difficulty.name: 0 for difficulty in targets}},
+    )
+
+    shards_done = 0
+    for difficulty in Difficulty:
+        if difficulty not in targets:
+            continue
+
+        shard_count = -(-targets[difficulty] // shard_size)
+        while checkpoint["completed"][difficulty.name] < shard_count:
+            if max_shards != None and shards_done >= max_shards:
+                return False
+
+            shard = checkpoint["completed"][difficulty.name]
+            board_count = min(shard_size, targets[difficulty] - shard * shard_size)
+            rng = random.Random(f"{seed}-{difficulty.name}-{shard}")
+
+            boards = [
+                format_board(generate_sudoku_board(difficulty, rules=rules, rng=rng))
+                for _ in range(board_count)
+            ]
+
+            shard_name = f"{difficulty.name.lower()}-{shard:05d}.txt"
+            _write_atomic(
+                os.path.join(output_directory, shard_name), "\n".join(boards) + "\n"
+            )
+
+            checkpoint["completed"][difficulty.name] += 1
+            _save_checkpoint(output_directory, checkpoint)
+            shards_done += 1
+
+    return True
+
+
+def _read_shard(file, shard_size: int) -> list:
+    """
+    Reads up to shard_size boards from a binary file, skipping blank lines
+    and lines starting with "#".
+    """
+    lines = []
+    while len(lines) < shard_size:
+        line = file.readline()
+        if line == b"":
+            break
+
+        line = line.decode(errors="replace").strip()
+        if line != "" and not line.startswith("#"):
+            lines.append(line)
+
+    return lines
+
+
+def _check_shard_size(shard_size: int):
+    if shard_size < 1:
+        raise ValueError(f"shard_size must be positive, got {shard_size}.")
+
+
+def _load_checkpoint(output_directory: str, settings: dict, progress: dict) -> dict:
+    """
+    Returns the saved checkpoint, or a new one made of settings and progress.
+    Raises ValueError if the saved one belongs to a job with other settings.
+    """
+    os.makedirs(output_directory, exist_ok=True)
+    path = os.path.join(output_directory, CHECKPOINT_FILE)
+
+    if not os.path.exists(path):
+        return {**settings, **progress}
+
+    with open(path) as file:
+        checkpoint = json.load(file)
+
+    for key, value in settings.items():
+        if checkpoint.get(key) != value:
+            raise ValueError(
+                f"{path} was written by a job with a different {key}: "
+                f"{checkpoint.get(key)!r}, not {value!r}."
+            )
+
+    return checkpoint
+
+
+def _save_checkpoint(output_directory: str, checkpoint: dict):
+    _write_atomic(
+        os.path.join(output_directory, CHECKPOINT_FILE), json.dumps(checkpoint)
+    )
+
+
+def _write_atomic(path: str, text: str):
+    """
+    Writes text to a temporary file and renames it over path. Both the file
+    and its directory are synced, so the rename survives a power loss too.
+    """
+    temporary_path = path + ".tmp"
+    with open(temporary_path, "w") as file:
+        file.write(text)
+        file.flush()
+        os.fsync(file.fileno())
+
+    os.replace(temporary_path, path)
+
+    # os.open can't open directories on Windows
+    if os.name == "posix":
+        directory = os.open(os.path.dirname(os.path.abspath(path)), os.O_RDONLY)
+        try:
+            os.fsync(directory)
+        finally:
+            os.close(directory)
@@ -0,0 +1,354 @@
+"""
+Constraint units for sudoku variants.
+
+A unit is a group of cells with optional rules attached: all digits distinct,
+a required total, or a custom predicate. Rules compiles a list of units into
+the per-cell tables the solver works with, so variants built from plain
+units (X-sudoku, jigsaw, killer, anti-knight) are solved with the same table
+lookups and propagation as the classic game.
+"""
+from array import array
+
+GRID_SIZE = 9
+BOX_SIZE = 3
+
+# Digits are stored as bits 1..9 of an int, so a whole unit fits in one mask.
+FULL_MASK = sum(1 << digit for digit in range(1, GRID_SIZE + 1))
+
+# Indexed by a candidate mask: the digits it holds and how many there are.
+MASK_DIGITS = tuple(
+    tuple(digit for digit in range(1, GRID_SIZE + 1) if mask & (1 << digit))
+    for mask in range(FULL_MASK + 1)
+)
+MASK_SIZE = bytes(len(digits) for digits in MASK_DIGITS)
+
+BOX_LAYOUT = [
+    [(row // BOX_SIZE) * BOX_SIZE + col // BOX_SIZE for col in range(GRID_SIZE)]
+    for row in range(GRID_SIZE)
+]
+
+KNIGHT_MOVES = ((1, 2), (2, 1), (2, -1), (1, -2))
+
+
+class ConstraintUnit:
+    def __init__(
+        self,
+        cells: list,
+        kind: str = "custom",
+        unique: bool = True,
+        total: int = None,
+        predicate=None,
+    ):
+        """
+        cells = list of (row, column) tuples.
+        kind = label used by the UI, e.g. "region", "diagonal" or "cage".
+        predicate = called with the unit's values (0 for blanks) whenever a
+        digit is placed in it; must return False once the unit can't be
+        completed. Prefer unique/total, which compile into lookup tables.
+        """
+        self.cells = tuple(cells)
+        self.kind = kind
+        self.unique = unique
+        self.total = total
+        self.predicate = predicate
+
+        if len(set(self.cells)) != len(self.cells):
+            raise ValueError("Constraint unit has repeated cells.")
+
+        if unique and len(self.cells) > GRID_SIZE:
+            raise ValueError(
+                f"Unique constraint unit can't have more than {GRID_SIZE} cells."
+            )
+
+
+class Rules:
+    def __init__(self, units: list):
+        self.units = tuple(units)
+
+        cell_units = [[[] for _ in range(GRID_SIZE)] for _ in range(GRID_SIZE)]
+        cell_sum_units = [[[] for _ in range(GRID_SIZE)] for _ in range(GRID_SIZE)]
+        cell_predicate_units = [
+            [[] for _ in range(GRID_SIZE)] for _ in range(GRID_SIZE)
+        ]
+        peers = [[set() for _ in range(GRID_SIZE)] for _ in range(GRID_SIZE)]
+
+        for unit_index, unit in enumerate(self.units):
+            for row, col in unit.cells:
+                if unit.unique:
+                    cell_units[row][col].append(unit_index)
+                    peers[row][col].update(unit.cells)
+                if unit.total != None:
+                    cell_sum_units[row][col].append(unit_index)
+                if unit.predicate != None:
+                    cell_predicate_units[row][col].append(unit_index)
+
+        for row in range(GRID_SIZE):
+            for col in range(GRID_SIZE):
+                peers[row][col].discard((row, col))
+
+        self.cell_units = _freeze(cell_units)
+        self.cell_sum_units = _freeze(cell_sum_units)
+        self.cell_predicate_units = _freeze(cell_predicate_units)
+        self.peers = tuple(
+            tuple(tuple(sorted(cells)) for cells in row) for row in peers
+        )
+        self.has_sums = any(unit.total != None for unit in self.units)
+        self.has_predicates = any(unit.predicate != None for unit in self.units)
+
+        # units holding every digit once, where a digit with a single place
+        # left must go there (hidden singles); cells as row * GRID_SIZE + col
+        self.full_units = tuple(
+            (unit_index, tuple(row * GRID_SIZE + col for row, col in unit.cells))
+            for unit_index, unit in enumerate(self.units)
+            if unit.unique and len(unit.cells) == GRID_SIZE
+        )
+
+        # pairs of full units sharing two or more cells, as (unit, its cells
+        # outside the other unit, the other unit's cells outside it): a digit
+        # the first unit can only place in the shared cells can't go in the
+        # other unit's remaining cells (locked candidates)
+        intersections = []
+        for first_index, first_cells in self.full_units:
+            for second_index, second_cells in self.full_units:
+                shared = set(first_cells) & set(second_cells)
+                if first_index != second_index and len(shared) > 1:
+                    intersections.append(
+                        (
+                            first_index,
+                            tuple(cell for cell in first_cells if cell not in shared),
+                            tuple(cell for cell in second_cells if cell not in shared),
+                        )
+                    )
+        self.unit_intersections = tuple(intersections)
+
+        if self.has_sums:
+            build_sum_candidates()
+
+    def extend(self, units: list) -> "Rules":
+        return Rules(self.units + tuple(units))
+
+    def describe(self) -> str:
+        """
+        Returns a short summary, e.g. "9 row, 9 column, 9 region, 2 diagonal".
+        """
+        counts = {}
+        for unit in self.units:
+            counts[unit.kind] = counts.get(unit.kind, 0) + 1
+
+        return ", ".join(f"{count} {kind}" for kind, count in counts.items())
+
+    def fingerprint(self) -> str:
+        """
+        Returns a stable hash of the units, used to tell rule sets apart in
+        job checkpoints. Predicates can't be compared between runs, so rules
+        with predicate units raise ValueError.
+        """
+        import hashlib
+        import json
+
+        description = []
+        for unit in self.units:
+            if unit.predicate != None:
+                raise ValueError(
+                    "Rules with predicate units can't be fingerprinted."
+                )
+
+            cells = [list(cell) for cell in unit.cells]
+            description.append([unit.kind, unit.unique, unit.total, cells])
+
+        return hashlib.sha256(json.dumps(description).encode()).hexdigest()
+
+    def units_of_kind(self, kind: str) -> list:
+        return [unit for unit in self.units if unit.kind == kind]
+
+    def sum_mask(
+        self, unit_index: int, placed_total: int, placed_count: int, used: int
+    ) -> int:
+        """
+        Returns the mask of digits that still fit the total of a sum unit
+        with placed_count cells filled, adding up to placed_total.
+        """
+        unit = self.units[unit_index]
+        remaining_count = len(unit.cells) - placed_count
+        remaining_total = unit.total - placed_total
+
+        if unit.unique:
+            return sum_candidates(remaining_count, remaining_total, used)
+
+        # digits may repeat, so only the bounds of the remaining cells matter
+        mask = 0
+        for digit in range(1, GRID_SIZE + 1):
+            rest = remaining_total - digit
+            if remaining_count - 1 <= rest <= (remaining_count - 1) * GRID_SIZE:
+                mask |= 1 << digit
+
+        return mask
+
+    def predicates_hold(self, sudoku_board: list, position: tuple) -> bool:
+        for unit_index in self.cell_predicate_units[position[0]][position[1]]:
+            unit = self.units[unit_index]
+            values = tuple(sudoku_board[row][col] for row, col in unit.cells)
+            if not unit.predicate(values):
+                return False
+
+        return True
+
+
+def _freeze(grid: list) -> tuple:
+    return tuple(tuple(tuple(indices) for indices in row) for row in grid)
+
+
+MAX_TOTAL = sum(range(1, GRID_SIZE + 1))
+USED_MASKS = (FULL_MASK >> 1) + 1
+
+
+def _build_sum_combinations() -> tuple:
+    """
+    combinations[count][total] = masks of count distinct digits adding up
+    to total.
+    """
+    combinations = [[[] for _ in range(MAX_TOTAL + 1)] for _ in range(GRID_SIZE + 1)]
+    for mask in range(0, FULL_MASK + 1, 2):
+        digits = MASK_DIGITS[mask]
+        combinations[len(digits)][sum(digits)].append(mask)
+
+    return tuple(tuple(tuple(masks) for masks in row) for row in combinations)
+
+
+SUM_COMBINATIONS = _build_sum_combinations()
+
+# sum_candidates lookup table, indexed by count, total and used digits. Only
+# sum units need it, so it is filled when the first Rules with sum units is
+# created. It is a flat array of unsigned shorts rather than a list of int
+# objects, so reading it doesn't touch reference counts: create the rules
+# before forking worker processes and the workers share its pages.
+SUM_CANDIDATES = array("H")
+
+
+def build_sum_candidates():
+    if len(SUM_CANDIDATES) > 0:
+        return
+
+    table = array("H", bytes(2 * (GRID_SIZE + 1) * (MAX_TOTAL + 1) * USED_MASKS))
+    for count in range(1, GRID_SIZE + 1):
+        for total in range(MAX_TOTAL + 1):
+            start = (count * (MAX_TOTAL + 1) + total) * USED_MASKS
+            for combination in SUM_COMBINATIONS[count][total]:
+                # add the combination to every used mask it doesn't overlap,
+                # walking the subsets of its complement
+                free = (FULL_MASK & ~combination) >> 1
+                used_index = free
+                while True:
+                    table[start + used_index] |= combination
+                    if used_index == 0:
+                        break
+                    used_index = (used_index - 1) & free
+
+    SUM_CANDIDATES.extend(table)
+
+
+def sum_candidates(count: int, total: int, used: int) -> int:
+    """
+    Returns the mask of digits that can start a set of count distinct digits,
+    none of them in used, adding up to total.
+    """
+    if count <= 0 or count > GRID_SIZE or total < 0 or total > MAX_TOTAL:
+        return 0
+
+    if len(SUM_CANDIDATES) == 0:
+        build_sum_candidates()
+
+    index = (count * (MAX_TOTAL + 1) + total) * USED_MASKS + (used >> 1)
+    return SUM_CANDIDATES[index]
+
+
+# Unit builders
+def row_units() -> list:
+    return [
+        ConstraintUnit([(row, col) for col in range(GRID_SIZE)], "row")
+        for row in range(GRID_SIZE)
+    ]
+
+
+def column_units() -> list:
+    return [
+        ConstraintUnit([(row, col) for row in range(GRID_SIZE)], "column")
+        for col in range(GRID_SIZE)
+    ]
+
+
+def region_units(layout: list) -> list:
+    """
+    layout = 9x9 grid of region labels, cells sharing a label form a region.
+    """
+    regions = {}
+    for row in range(GRID_SIZE):
+        for col in range(GRID_SIZE):
+            regions.setdefault(layout[row][col], []).append((row, col))
+
+    for label, cells in regions.items():
+        if len(cells) != GRID_SIZE:
+            raise ValueError(
+                f"Region {label!r} has {len(cells)} cells, expected {GRID_SIZE}."
+            )
+
+    return [ConstraintUnit(cells, "region") for cells in regions.values()]
+
+
+def standard_units(layout: list = None) -> list:
+    """
+    Rows, columns and regions; 3x3 boxes unless a jigsaw layout is given.
+    """
+    if layout == None:
+        layout = BOX_LAYOUT
+
+    return row_units() + column_units() + region_units(layout)
+
+
+def diagonal_units() -> list:
+    return [
+        ConstraintUnit([(index, index) for index in range(GRID_SIZE)], "diagonal"),
+        ConstraintUnit(
+            [(index, GRID_SIZE - 1 - index) for index in range(GRID_SIZE)],
+            "diagonal",
+        ),
+    ]
+
+
+def cage_units(cages: list) -> list:
+    """
+    cages = list of (total, cells) pairs.
+    """
+    return [ConstraintUnit(cells, "cage", total=total) for total, cells in cages]
+
+
+def anti_knight_units() -> list:
+    units = []
+    for row in range(GRID_SIZE):
+        for col in range(GRID_SIZE):
+            for row_step, col_step in KNIGHT_MOVES:
+                other = (row + row_step, col + col_step)
+                if 0 <= other[0] < GRID_SIZE and 0 <= other[1] < GRID_SIZE:
+                    units.append(ConstraintUnit([(row, col), other], "knight"))
+
+    return units
+
+
+def parse_layout(line: str) -> list:
+    """
+    Parses a jigsaw layout written as 81 region labels, read row by row.
+    """
+    line = line.strip()
+    if len(line) != GRID_SIZE * GRID_SIZE:
+        raise ValueError(
+            f"Expected {GRID_SIZE * GRID_SIZE} characters, got {len(line)}."
+        )
+
+    return [
+        list(line[row * GRID_SIZE : (row + 1) * GRID_SIZE]) for row in range(GRID_SIZE)
+    ]
+
+
+# Built once, at import time. Rules tables are small tuples (a few KB), so
+# workers forked after import share them until use touches reference counts.
+CLASSIC_RULES = Rules(standard_units())
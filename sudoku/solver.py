@@ -0,0 +1,263 @@
+from enum import Enum
+
+from sudoku.rules import (
+    CLASSIC_RULES,
+    FULL_MASK,
+    GRID_SIZE,
+    MASK_DIGITS,
+    MASK_SIZE,
+    Rules,
+)
+
+BLANK_GRID = [[0] * GRID_SIZE for _ in range(GRID_SIZE)]
+
+
+class Difficulty(Enum):
+    Easy = 2
+    Medium = 4
+    Hard = 6
+
+
+def check_valid_option(
+    number: int, sudoku_board: list, position: tuple, rules: Rules = CLASSIC_RULES
+) -> bool:
+    row, col = position
+    for row_index, col_index in rules.peers[row][col]:
+        if sudoku_board[row_index][col_index] == number:
+            return False
+
+    bit = 1 << number
+    for unit_index in rules.cell_sum_units[row][col]:
+        placed_total, placed_count, used = 0, 0, 0
+        for row_index, col_index in rules.units[unit_index].cells:
+            item = sudoku_board[row_index][col_index]
+            if item != 0 and (row_index, col_index) != position:
+                placed_total += item
+                placed_count += 1
+                used |= 1 << item
+
+        if not rules.sum_mask(unit_index, placed_total, placed_count, used) & bit:
+            return False
+
+    if rules.cell_predicate_units[row][col]:
+        previous = sudoku_board[row][col]
+        sudoku_board[row][col] = number
+        valid = rules.predicates_hold(sudoku_board, position)
+        sudoku_board[row][col] = previous
+        return valid
+
+    return True
+
+
+def solve_board(
+    sudoku_board: list, rules: Rules = CLASSIC_RULES, max_steps: int = None
+) -> bool:
+    """
+    Fills sudoku_board in place. Returns False if the board has no solution,
+    or if it wasn't found within max_steps guesses. A guess is a choice
+    between two or more options; forced placements don't count.
+    """
+    unit_count = len(rules.units)
+    unit_masks = [0] * unit_count
+    unit_totals = [0] * unit_count
+    unit_filled = [0] * unit_count
+    empty_cells = []
+
+    for row_index, row in enumerate(sudoku_board):
+        for column_index, item in enumerate(row):
+            if item == 0:
+                empty_cells.append((row_index, column_index))
+                continue
+
+            bit = 1 << item
+            for unit_index in rules.cell_units[row_index][column_index]:
+                if unit_masks[unit_index] & bit:
+                    return False
+                unit_masks[unit_index] |= bit
+
+            for unit_index in rules.cell_sum_units[row_index][column_index]:
+                unit_totals[unit_index] += item
+                unit_filled[unit_index] += 1
+
+    for unit_index, unit in enumerate(rules.units):
+        if unit.total != None and unit_filled[unit_index] == len(unit.cells):
+            if unit_totals[unit_index] != unit.total:
+                return False
+        if unit.predicate != None:
+            values = tuple(sudoku_board[row][col] for row, col in unit.cells)
+            if not unit.predicate(values):
+                return False
+
+    steps_left = [max_steps]
+    state = (unit_masks, unit_totals, unit_filled, steps_left)
+    return _backtrack_solve(sudoku_board, empty_cells, state, rules)
+
+
+def _backtrack_solve(
+    sudoku_board: list, empty_cells: list, state: tuple, rules: Rules
+) -> bool:
+    if len(empty_cells) == 0:
+        return True
+
+    unit_masks, unit_totals, unit_filled, steps_left = state
+
+    # pick the most constrained cell first
+    best_index = 0
+    best_candidates = 0
+    best_count = GRID_SIZE + 1
+    cell_candidates = [0] * (GRID_SIZE * GRID_SIZE)
+    for index, (row, col) in enumerate(empty_cells):
+        used = 0
+        for unit_index in rules.cell_units[row][col]:
+            used |= unit_masks[unit_index]
+        candidates = FULL_MASK & ~used
+
+        for unit_index in rules.cell_sum_units[row][col]:
+            candidates &= rules.sum_mask(
+                unit_index,
+                unit_totals[unit_index],
+                unit_filled[unit_index],
+                unit_masks[unit_index],
+            )
+
+        cell_candidates[row * GRID_SIZE + col] = candidates
+        count = MASK_SIZE[candidates]
+        if count < best_count:
+            best_index, best_candidates, best_count = index, candidates, count
+            if count <= 1:
+                break
+
+    if best_count == 0:
+        return False
+
+    # choices to branch on, as (cell, candidate digits) pairs
+    row, col = empty_cells[best_index]
+    choices = [(row * GRID_SIZE + col, best_candidates)]
+
+    if best_count > 1:
+        choices, best_count = _unit_choices(
+            choices, best_count, cell_candidates, unit_masks, rules
+        )
+
+    if best_count > 2:
+        # still no cheap choice, look for locked digits and try again
+        best_index, best_count = _eliminate_locked_candidates(
+            empty_cells, cell_candidates, unit_masks, rules
+        )
+        if best_count > 0:
+            row, col = empty_cells[best_index]
+            cell = row * GRID_SIZE + col
+            choices = [(cell, cell_candidates[cell])]
+            choices, best_count = _unit_choices(
+                choices, best_count, cell_candidates, unit_masks, rules
+            )
+
+    if best_count == 0:
+        return False
+
+    if best_count > 1 and steps_left[0] != None:
+        # only branching choices count as guesses
+        if steps_left[0] == 0:
+            return False
+        steps_left[0] -= 1
+
+    for cell, candidates in choices:
+        row, col = divmod(cell, GRID_SIZE)
+        empty_cells.remove((row, col))
+
+        cell_units = rules.cell_units[row][col]
+        cell_sum_units = rules.cell_sum_units[row][col]
+        for number in MASK_DIGITS[candidates]:
+            bit = 1 << number
+            for unit_index in cell_units:
+                unit_masks[unit_index] |= bit
+            for unit_index in cell_sum_units:
+                unit_totals[unit_index] += number
+                unit_filled[unit_index] += 1
+            sudoku_board[row][col] = number
+
+            if not rules.has_predicates or rules.predicates_hold(
+                sudoku_board, (row, col)
+            ):
+                if _backtrack_solve(sudoku_board, empty_cells, state, rules):
+                    return True
+
+            for unit_index in cell_units:
+                unit_masks[unit_index] &= ~bit
+            for unit_index in cell_sum_units:
+                unit_totals[unit_index] -= number
+                unit_filled[unit_index] -= 1
+
+        sudoku_board[row][col] = 0
+        empty_cells.append((row, col))
+
+    return False
+
+
+
+def _unit_choices(
+    choices: list,
+    best_count: int,
+    cell_candidates: list,
+    unit_masks: list,
+    rules: Rules,
+) -> tuple:
+    """
+    Looks for a digit of a full unit with fewer places left than best_count,
+    returns (choices, count). Count is 0 if some digit has no place left.
+    """
+    for unit_index, cells in rules.full_units:
+        once, twice, thrice = 0, 0, 0
+        for cell in cells:
+            candidates = cell_candidates[cell]
+            thrice |= twice & candidates
+            twice |= once & candidates
+            once |= candidates
+
+        missing = FULL_MASK & ~unit_masks[unit_index]
+        if missing & ~once:
+            return choices, 0
+
+        # a digit with a single place left in the unit must go there
+        hidden = missing & ~twice
+        if hidden:
+            bit = hidden & -hidden
+            cell = next(cell for cell in cells if cell_candidates[cell] & bit)
+            return [(cell, bit)], 1
+
+        # a digit with two places is a two-way choice, better than trying
+        # the digits of a cell with more candidates
+        pair = missing & ~thrice
+        if pair and best_count > 2:
+            bit = pair & -pair
+            choices = [(cell, bit) for cell in cells if cell_candidates[cell] & bit]
+            best_count = 2
+
+    return choices, best_count
+
+def _eliminate_locked_candidates(
+    empty_cells: list, cell_candidates: list, unit_masks: list, rules: Rules
+) -> tuple:
+    """
+    Removes candidates ruled out by locked digits from cell_candidates and
+    returns (index, count) of the most constrained empty cell.
+    """
+    for unit_index, outside_cells, other_cells in rules.unit_intersections:
+        outside = 0
+        for cell in outside_cells:
+            outside |= cell_candidates[cell]
+
+        locked = FULL_MASK & ~unit_masks[unit_index] & ~outside
+        if locked:
+            for cell in other_cells:
+                cell_candidates[cell] &= ~locked
+
+    best_index, best_count = 0, GRID_SIZE + 1
+    for index, (row, col) in enumerate(empty_cells):
+        count = MASK_SIZE[cell_candidates[row * GRID_SIZE + col]]
+        if count < best_count:
+            best_index, best_count = index, count
+            if count <= 1:
+                break
+
+    return best_index, best_count
@@ -0,0 +1,112 @@
+import os
+
+import pytest
+
+from sudoku.cli import main
+from sudoku.generator import generate_sudoku_board
+from sudoku.io import format_board
+from sudoku.jobs import INVALID, generate_corpus, solve_corpus
+from sudoku.rules import Rules, diagonal_units, standard_units
+from sudoku.solver import Difficulty
+
+TARGETS = {Difficulty.Easy: 7, Difficulty.Hard: 5}
+
+
+def read_directory(directory) -> dict:
+    return {
+        name: (directory / name).read_text() for name in sorted(os.listdir(directory))
+    }
+
+
+def run_interrupted(job, *args, **kwargs):
+    """
+    Runs job one shard at a time, like a job killed after every shard.
+    """
+    while not job(*args, max_shards=1, **kwargs):
+        pass
+
+
+@pytest.fixture
+def corpus(tmp_path):
+    path = tmp_path / "corpus.txt"
+    lines = ["# generated corpus", ""]
+    for _ in range(9):
+        lines.append(format_board(generate_sudoku_board(Difficulty.Hard)))
+    path.write_text("\n".join(lines) + "\n\n")
+    return path
+
+
+def test_generate_corpus_resumes_to_identical_output(tmp_path):
+    assert generate_corpus(tmp_path / "full", TARGETS, 3, seed=5)
+    run_interrupted(generate_corpus, tmp_path / "resumed", TARGETS, 3, seed=5)
+
+    assert read_directory(tmp_path / "full") == read_directory(tmp_path / "resumed")
+    assert (tmp_path / "full" / "hard-00001.txt").read_text().count("\n") == 2
+
+
+def test_solve_corpus_resumes_to_identical_output(tmp_path, corpus):
+    assert solve_corpus(corpus, tmp_path / "full", 4)
+    run_interrupted(solve_corpus, corpus, tmp_path / "resumed", 4)
+
+    assert read_directory(tmp_path / "full") == read_directory(tmp_path / "resumed")
+
+
+def test_solve_corpus_finished_when_only_blank_lines_remain(tmp_path, corpus):
+    # 9 boards: the third shard holds the last one, only blank lines follow it
+    assert not solve_corpus(corpus, tmp_path / "out", 4, max_shards=2)
+    assert solve_corpus(corpus, tmp_path / "out", 4, max_shards=1)
+
+
+def test_resume_with_other_settings_is_refused(tmp_path, corpus):
+    generate_corpus(tmp_path / "generated", TARGETS, 3, max_shards=1)
+    with pytest.raises(ValueError, match="seed"):
+        generate_corpus(tmp_path / "generated", TARGETS, 3, seed=1)
+
+    diagonal_rules = Rules(standard_units() + diagonal_units())
+    with pytest.raises(ValueError, match="rules"):
+        generate_corpus(tmp_path / "generated", TARGETS, 3, rules=diagonal_rules)
+
+    solve_corpus(corpus, tmp_path / "solved", 4, max_shards=1)
+    with pytest.raises(ValueError, match="rules"):
+        solve_corpus(corpus, tmp_path / "solved", 4, rules=diagonal_rules)
+
+
+def test_malformed_lines_are_marked_invalid(tmp_path, corpus):
+    board = corpus.read_text().splitlines()[2]
+    corpus.write_text(f"{board}\n123\n{board[:-1]}x\n{board}\n")
+
+    assert solve_corpus(corpus, tmp_path / "out", 2)
+
+    solved = (tmp_path / "out" / "solved-00000.txt").read_text().splitlines()
+    solved += (tmp_path / "out" / "solved-00001.txt").read_text().splitlines()
+    assert solved[1:3] == [INVALID, INVALID]
+    assert solved[0] == solved[3] and "0" not in solved[0]
+
+
+@pytest.mark.parametrize("job", ["solve", "generate"])
+def test_shard_size_must_be_positive(tmp_path, corpus, job):
+    with pytest.raises(ValueError, match="shard_size"):
+        if job == "solve":
+            solve_corpus(corpus, tmp_path / "out", 0)
+        else:
+            generate_corpus(tmp_path / "out", TARGETS, 0)
+
+
+def test_cli_reports_missing_input(tmp_path, capsys):
+    missing = tmp_path / "missing.txt"
+
+    assert main(["solve-corpus", str(missing), str(tmp_path / "out")]) == 1
+    assert str(missing) in capsys.readouterr().err
+
+
+@pytest.mark.parametrize(
+    "arguments",
+    [
+        ["generate-corpus", "out", "--easy", "-1"],
+        ["generate-corpus", "out", "--shard-size", "0"],
+        ["generate", "-n", "0"],
+    ],
+)
+def test_cli_rejects_bad_counts(arguments):
+    with pytest.raises(SystemExit):
+        main(arguments)
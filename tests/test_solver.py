@@ -0,0 +1,122 @@
+import random
+
+from sudoku.cli import main
+from sudoku.generator import generate_solvable_board, generate_sudoku_board
+from sudoku.io import format_board, parse_board
+from sudoku.solver import Difficulty, check_valid_option, solve_board
+
+EASY = (
+    "530070000600195000098000060800060003400803001"
+    "700020006060000280000419005000080079"
+)
+EASY_SOLUTION = (
+    "534678912672195348198342567859761423426853791"
+    "713924856961537284287419635345286179"
+)
+HARD = (
+    "800000000003600000070090200050007000000045700"
+    "000100030001000068008500010090000400"
+)
+
+
+def is_solution(board: list) -> bool:
+    digits = list(range(1, 10))
+    for index in range(9):
+        row = board[index]
+        column = [board[row_index][index] for row_index in range(9)]
+        box = [
+            board[3 * (index // 3) + row_index][3 * (index % 3) + col_index]
+            for row_index in range(3)
+            for col_index in range(3)
+        ]
+        if sorted(row) != digits or sorted(column) != digits or sorted(box) != digits:
+            return False
+
+    return True
+
+
+def test_solves_known_puzzles():
+    board = parse_board(EASY)
+    assert solve_board(board)
+    assert format_board(board) == EASY_SOLUTION
+
+    board = parse_board(HARD)
+    assert solve_board(board)
+    assert is_solution(board)
+    assert all(
+        board[index // 9][index % 9] == int(given)
+        for index, given in enumerate(HARD)
+        if given != "0"
+    )
+
+
+def test_bad_givens_are_unsolvable():
+    board = parse_board(EASY)
+    board[0][2] = 5  # second 5 in the first row
+    assert not solve_board(board)
+
+    # no row conflicts, but the top-left cell has no candidate left
+    board = parse_board("0" + "12345678" + "0" * 72)
+    board[1][0] = 9
+    assert not solve_board(board)
+
+
+def test_check_valid_option():
+    board = parse_board(EASY)
+    assert not check_valid_option(5, board, (0, 2))
+    assert check_valid_option(4, board, (0, 2))
+
+
+def test_generated_boards_are_solvable():
+    rng = random.Random(0)
+    solution = generate_solvable_board(rng=rng)
+    assert is_solution(solution)
+
+    board = generate_sudoku_board(Difficulty.Hard, solution, rng=rng)
+    assert sum(row.count(0) for row in board) == Difficulty.Hard.value * 9
+    assert solve_board(board)
+    assert is_solution(board)
+
+
+def test_sudoku_solver_shim():
+    import sudoku_solver
+
+    for name in (
+        "BLANK_GRID",
+        "GRID_SIZE",
+        "Difficulty",
+        "backtrack_solve",
+        "check_valid_option",
+        "generate_solvable_board",
+        "generate_sudoku_board",
+        "prepare_board",
+        "print_formatted_sudoku_grid",
+        "solve_board",
+    ):
+        assert hasattr(sudoku_solver, name)
+
+    board = parse_board(EASY)
+    sudoku_solver.backtrack_solve((0, 2), board)
+    assert format_board(board) == EASY_SOLUTION
+
+
+def test_cli_generate_and_solve(tmp_path):
+    puzzles = tmp_path / "puzzles.txt"
+    solutions = tmp_path / "solutions.txt"
+
+    assert main(["generate", "-d", "Easy", "-n", "3", "-o", str(puzzles)]) == 0
+    assert main(["solve", str(puzzles), "-o", str(solutions)]) == 0
+
+    solved = solutions.read_text().splitlines()
+    assert len(solved) == 3
+    assert all(is_solution(parse_board(line)) for line in solved)
+
+
+def test_cli_solve_reports_bad_lines(tmp_path, capsys):
+    puzzles = tmp_path / "puzzles.txt"
+    puzzles.write_text(f"{EASY}\n123\n")
+
+    assert main(["solve", str(puzzles)]) == 1
+    output = capsys.readouterr()
+    assert output.out == EASY_SOLUTION + "\n"
+    assert "line 2" in output.err
@@ -0,0 +1,107 @@
+import random
+import time
+
+import pytest
+
+from sudoku.generator import generate_solvable_board
+from sudoku.rules import (
+    CLASSIC_RULES,
+    Rules,
+    anti_knight_units,
+    cage_units,
+    diagonal_units,
+    parse_layout,
+    standard_units,
+)
+from sudoku.solver import solve_board
+
+# The jigsaw layout shown in README.md
+JIGSAW_LAYOUT = (
+    "000111222000011222001141222333441555333444555"
+    "336444585636777588666777888666777888"
+)
+
+# Generous, generation normally takes a few milliseconds
+TIME_LIMIT = 10
+
+
+def killer_rules(rng: random.Random) -> Rules:
+    """
+    Cuts a classic solution into dominoes, so the cages are always solvable.
+    """
+    solution = generate_solvable_board(rng=rng)
+    cages = []
+    for row in range(9):
+        for col in range(0, 8, 2):
+            cells = [(row, col), (row, col + 1)]
+            cages.append((sum(solution[r][c] for r, c in cells), cells))
+        cages.append((solution[row][8], [(row, 8)]))
+
+    return Rules(standard_units() + cage_units(cages))
+
+
+def is_solution(board: list, rules: Rules) -> bool:
+    for unit in rules.units:
+        values = [board[row][col] for row, col in unit.cells]
+        if 0 in values:
+            return False
+        if unit.unique and len(set(values)) != len(values):
+            return False
+        if unit.total != None and sum(values) != unit.total:
+            return False
+
+    return True
+
+
+@pytest.mark.parametrize(
+    "rules",
+    [
+        CLASSIC_RULES,
+        Rules(standard_units() + diagonal_units()),
+        Rules(standard_units() + anti_knight_units()),
+        Rules(standard_units(parse_layout(JIGSAW_LAYOUT))),
+        killer_rules(random.Random(0)),
+    ],
+    ids=["classic", "diagonal", "anti-knight", "jigsaw", "killer"],
+)
+def test_documented_variants_generate_in_bounded_time(rules):
+    for seed in range(5):
+        started = time.perf_counter()
+        board = generate_solvable_board(rules, random.Random(seed))
+
+        assert time.perf_counter() - started < TIME_LIMIT
+        assert is_solution(board, rules)
+
+
+def test_contradictory_rules_raise_instead_of_hanging():
+    # two cages give the top-left cell different totals
+    rules = CLASSIC_RULES.extend(cage_units([(1, [(0, 0)]), (2, [(0, 0)])]))
+
+    started = time.perf_counter()
+    with pytest.raises(ValueError, match="cage"):
+        generate_solvable_board(rules, random.Random(0))
+
+    assert time.perf_counter() - started < TIME_LIMIT
+    assert not solve_board([[0] * 9 for _ in range(9)], rules)
+
+
+def test_solve_board_respects_max_steps():
+    rules = Rules(standard_units() + diagonal_units() + anti_knight_units())
+    board = [[0] * 9 for _ in range(9)]
+
+    started = time.perf_counter()
+    assert not solve_board(board, rules, max_steps=100)
+    assert time.perf_counter() - started < TIME_LIMIT
+    assert board == [[0] * 9 for _ in range(9)]
+
+
+def test_forced_placements_are_not_guesses():
+    # solvable with naked and hidden singles alone
+    board = [[0] * 9 for _ in range(9)]
+    for index, given in enumerate(
+        "530070000600195000098000060800060003400803001"
+        "700020006060000280000419005000080079"
+    ):
+        board[index // 9][index % 9] = int(given)
+
+    assert solve_board(board, max_steps=0)